@@ -1,22 +1,46 @@
 """CLI for the Agent Memory System."""
 
+from typing import TYPE_CHECKING, Sequence
+
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from datetime import datetime, timezone
 
 from .issue import Issue, Status
-from .storage import IssueStore, StorageError
+from .storage import Columns, IssueStore, StorageError
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Status names accepted on the command line
+_STATUS_CHOICE = click.Choice([status.label for status in Status])
+
+# Rich is imported on first use so commands don't pay for it at startup
+_console_instance: "Console | None" = None
+
+
+def _console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console_instance
+    if _console_instance is None:
+        from rich.console import Console
 
-console = Console()
+        _console_instance = Console()
+    return _console_instance
 
 
 @click.group()
-def ams() -> None:
+@click.pass_context
+def ams(ctx: click.Context) -> None:
     """Agent Memory System - Simple issue tracking for AI agents."""
-    pass
+    ctx.ensure_object(IssueStore)
+
+
+@ams.result_callback()
+@click.pass_obj
+def flush_store(store: IssueStore, result: object) -> None:
+    """Write batched metadata changes once the command has finished."""
+    store.flush()
 
 
 @ams.command()
@@ -28,11 +52,18 @@ def ams() -> None:
     type=int,
     help="ID of issue that blocks this one (can be used multiple times)",
 )
-def create(title: str, description: str | None, blocked_by: tuple[int, ...]) -> None:
+@click.pass_obj
+def create(
+    store: IssueStore,
+    title: str,
+    description: str | None,
+    blocked_by: tuple[int, ...],
+) -> None:
     """Create a new issue with the given TITLE."""
-    try:
-        store = IssueStore()
+    from rich.panel import Panel
 
+    console = _console()
+    try:
         # Get existing IDs for validation
         existing_ids = store.get_all_ids()
 
@@ -57,7 +88,7 @@ def create(title: str, description: str | None, blocked_by: tuple[int, ...]) ->
         )
 
         # Save to store
-        store.save_issue(issue)
+        store.save_issue_append(issue)
 
         # Success output
         console.print(
@@ -71,56 +102,128 @@ def create(title: str, description: str | None, blocked_by: tuple[int, ...]) ->
         if description:
             console.print(f"  Description: {description}")
         if blocked_by_list:
-            console.print(f"  Blocked by: {blocked_by_list}")
+            console.print(f"  Blocked by: {sorted(issue.blocked_by)}")
 
     except StorageError as e:
         console.print(f"[red]Storage error:[/red] {e}")
         raise SystemExit(1)
 
 
-def _status_style(status: Status) -> str:
-    """Return Rich style for a status."""
-    return {
-        Status.OPEN: "yellow",
-        Status.IN_PROGRESS: "cyan",
-        Status.DONE: "green",
-    }.get(status, "white")
+# Rich style for each status
+_STATUS_STYLE = {
+    Status.OPEN: "yellow",
+    Status.IN_PROGRESS: "cyan",
+    Status.DONE: "green",
+}
+_status_style = _STATUS_STYLE.__getitem__
+
+
+# Above this many rows, list skips Rich's Table layout, which gets slow
+LIST_TABLE_MAX_ROWS = 500
+
+
+def _list_row(cols: Columns, row: int) -> tuple[str, Status, str, str]:
+    """Format one row of list output: ID, status, title and blockers."""
+    blocked = ", ".join(f"#{b}" for b in sorted(cols.blocked_by[row])) or "-"
+    status = Status.from_json(cols.statuses[row])
+    return f"#{cols.ids[row]}", status, cols.titles[row], blocked
+
+
+def _print_issue_table(console: "Console", cols: Columns, rows: Sequence[int]) -> None:
+    """Print the given rows of cols as a Rich table."""
+    from rich.markup import escape
+    from rich.table import Table
+
+    table = Table(title="Issues")
+    table.add_column("ID", style="bold", width=6, no_wrap=True)
+    table.add_column("Status", width=12, no_wrap=True)
+    table.add_column("Title")
+    table.add_column("Blocked By", width=12)
+
+    for row in rows:
+        id_str, status, title, blocked = _list_row(cols, row)
+        style = _status_style(status)
+        table.add_row(
+            id_str,
+            f"[{style}]{status.label}[/{style}]",
+            escape(title),
+            blocked,
+        )
+
+    console.print(table)
+
+
+def _print_issue_lines(console: "Console", cols: Columns, rows: Sequence[int]) -> None:
+    """Print the given rows of cols as pre-formatted, column-aligned lines."""
+    from rich.markup import escape
+
+    # Same columns as _print_issue_table; titles are padded before escaping
+    # so markup backslashes don't count towards the width
+    width = max(len("Title"), *(len(cols.titles[row]) for row in rows))
+    lines = [f"[bold]{'ID':<6} {'Status':<12} {'Title':<{width}} Blocked By[/bold]"]
+    for row in rows:
+        id_str, status, title, blocked = _list_row(cols, row)
+        style = _status_style(status)
+        lines.append(
+            f"{id_str:<6} "
+            f"[{style}]{status.label:<12}[/{style}] "
+            f"{escape(title)}{' ' * (width - len(title))} {blocked}"
+        )
+    console.print("\n".join(lines), highlight=False, soft_wrap=True)
 
 
 @ams.command("list")
-@click.option("--status", "-s", type=click.Choice(["open", "in-progress", "done"]))
-def list_issues(status: str | None) -> None:
-    """List all issues in a table."""
+@click.option("--status", "-s", type=_STATUS_CHOICE)
+@click.option(
+    "--limit",
+    "-n",
+    type=click.IntRange(min=0),
+    default=50,
+    show_default=True,
+    help="Maximum number of issues to show (0 for all)",
+)
+@click.option(
+    "--offset",
+    type=click.IntRange(min=0),
+    default=0,
+    help="Number of issues to skip",
+)
+@click.pass_obj
+def list_issues(
+    store: IssueStore, status: str | None, limit: int, offset: int
+) -> None:
+    """List issues in a table, one page at a time."""
+    console = _console()
     try:
-        store = IssueStore()
-        issues = store.load_all()
+        # Only the listed fields are loaded, column-wise; no Issue objects
+        cols = store.load_columnar()
+        rows: Sequence[int] = range(len(cols.ids))
 
         # Filter by status if provided
         if status:
-            filter_status = Status(status)
-            issues = [i for i in issues if i.status == filter_status]
-
-        if not issues:
-            console.print("[dim]No issues found.[/dim]")
+            filter_status = Status.from_label(status)
+            rows = [r for r in rows if cols.statuses[r] == filter_status]
+
+        # Only render the requested page
+        total = len(rows)
+        rows = rows[offset:offset + limit] if limit else rows[offset:]
+
+        if not rows:
+            if total:
+                console.print(f"[dim]No issues on this page ({total} total).[/dim]")
+            else:
+                console.print("[dim]No issues found.[/dim]")
             return
 
-        table = Table(title="Issues")
-        table.add_column("ID", style="bold", width=6)
-        table.add_column("Status", width=12)
-        table.add_column("Title")
-        table.add_column("Blocked By", width=12)
-
-        for issue in issues:
-            style = _status_style(issue.status)
-            blocked = ", ".join(f"#{b}" for b in issue.blocked_by) if issue.blocked_by else "-"
-            table.add_row(
-                f"#{issue.id}",
-                f"[{style}]{issue.status.value}[/{style}]",
-                issue.title,
-                blocked,
-            )
+        if len(rows) > LIST_TABLE_MAX_ROWS:
+            _print_issue_lines(console, cols, rows)
+        else:
+            _print_issue_table(console, cols, rows)
 
-        console.print(table)
+        if len(rows) < total:
+            console.print(
+                f"[dim]Showing {offset + 1}–{offset + len(rows)} of {total}[/dim]"
+            )
 
     except StorageError as e:
         console.print(f"[red]Storage error:[/red] {e}")
@@ -129,10 +232,13 @@ def list_issues(status: str | None) -> None:
 
 @ams.command()
 @click.argument("id", type=int)
-def show(id: int) -> None:
+@click.pass_obj
+def show(store: IssueStore, id: int) -> None:
     """Show details of issue with given ID."""
+    from rich.panel import Panel
+
+    console = _console()
     try:
-        store = IssueStore()
         issue = store.get_by_id(id)
 
         if not issue:
@@ -140,13 +246,12 @@ def show(id: int) -> None:
             raise SystemExit(1)
 
         # Find what this issue blocks (reverse lookup)
-        all_issues = store.load_all()
-        blocks = [i.id for i in all_issues if id in i.blocked_by]
+        blocks = store.blocks_of(id)
 
         # Build content
         style = _status_style(issue.status)
         lines = [
-            f"[bold]Status:[/bold] [{style}]{issue.status.value}[/{style}]",
+            f"[bold]Status:[/bold] [{style}]{issue.status.label}[/{style}]",
             f"[bold]Created:[/bold] {issue.created_at.strftime('%Y-%m-%d %H:%M')}",
             f"[bold]Updated:[/bold] {issue.updated_at.strftime('%Y-%m-%d %H:%M')}",
         ]
@@ -155,7 +260,7 @@ def show(id: int) -> None:
             lines.insert(0, f"\n{issue.description}\n")
 
         if issue.blocked_by:
-            blocked_str = ", ".join(f"#{b}" for b in issue.blocked_by)
+            blocked_str = ", ".join(f"#{b}" for b in sorted(issue.blocked_by))
             lines.append(f"[bold]Blocked by:[/bold] {blocked_str}")
 
         if blocks:
@@ -177,11 +282,13 @@ def show(id: int) -> None:
 
 @ams.command()
 @click.argument("id", type=int)
-@click.option("--status", "-s", type=click.Choice(["open", "in-progress", "done"]), help="Change status")
+@click.option("--status", "-s", type=_STATUS_CHOICE, help="Change status")
 @click.option("--description", "-d", default=None, help="Update description")
 @click.option("--add-blocker", type=int, multiple=True, help="Add a blocking issue")
 @click.option("--remove-blocker", type=int, multiple=True, help="Remove a blocking issue")
+@click.pass_obj
 def update(
+    store: IssueStore,
     id: int,
     status: str | None,
     description: str | None,
@@ -189,8 +296,10 @@ def update(
     remove_blocker: tuple[int, ...],
 ) -> None:
     """Update an existing issue."""
+    from rich.panel import Panel
+
+    console = _console()
     try:
-        store = IssueStore()
         issue = store.get_by_id(id)
 
         if not issue:
@@ -202,37 +311,33 @@ def update(
             raise SystemExit(1)
 
         if status:
-            issue.status = Status(status)
+            issue.status = Status.from_label(status)
 
         if description is not None:
             issue.description = description
 
-        existing_ids = store.get_all_ids()
-
         if add_blocker:
             for bid in add_blocker:
-                if bid not in existing_ids:
+                if store.get_by_id(bid) is None:
                     console.print(f"[red]Error:[/red] Issue #{bid} does not exist.")
                     raise SystemExit(1)
                 if bid == id:
                     console.print("[red]Error:[/red] Issue cannot block itself.")
                     raise SystemExit(1)
-                if bid not in issue.blocked_by:
-                    issue.blocked_by.append(bid)
+                issue.blocked_by.add(bid)
 
         if remove_blocker:
             for bid in remove_blocker:
-                if bid in issue.blocked_by:
-                    issue.blocked_by.remove(bid)
+                issue.blocked_by.discard(bid)
 
         issue.updated_at = datetime.now(timezone.utc)
-        store.save_issue(issue)
+        store.save_issue_update(issue)
 
         # Show updated issue
         style = _status_style(issue.status)
         console.print(
             Panel(
-                f"[bold]Status:[/bold] [{style}]{issue.status.value}[/{style}]",
+                f"[bold]Status:[/bold] [{style}]{issue.status.label}[/{style}]",
                 title=f"[bold]Updated #{issue.id}[/bold] {issue.title}",
                 border_style="blue",
             )
@@ -245,10 +350,11 @@ def update(
 
 @ams.command()
 @click.argument("id", type=int)
-def done(id: int) -> None:
+@click.pass_obj
+def done(store: IssueStore, id: int) -> None:
     """Mark an issue as done and show impact."""
+    console = _console()
     try:
-        store = IssueStore()
         issue = store.get_by_id(id)
 
         if not issue:
@@ -260,13 +366,12 @@ def done(id: int) -> None:
             return
 
         # Find what this issue blocks before marking done
-        all_issues = store.load_all()
-        blocked_issues = [i for i in all_issues if id in i.blocked_by]
+        blocked_issues = store.get_many(store.blocks_of(id))
 
         # Mark done
         issue.status = Status.DONE
         issue.updated_at = datetime.now(timezone.utc)
-        store.save_issue(issue)
+        store.save_issue_update(issue)
 
         console.print(f"\n[bold green]✓[/bold green] Marked issue [bold]#{id}[/bold] as done")
 
@@ -276,12 +381,10 @@ def done(id: int) -> None:
             console.print(f"\n[yellow]⚠ Warning: This issue was blocking:[/yellow]\n{names}")
 
             # Find newly unblocked: open, and all their blockers are now done
-            all_issues = store.load_all()
-            done_ids = {i.id for i in all_issues if i.status == Status.DONE}
             newly_ready = [
                 i for i in blocked_issues
                 if i.status == Status.OPEN
-                and all(b in done_ids for b in i.blocked_by)
+                and store.remaining_blockers(i.id) == 0
             ]
 
             if newly_ready:
@@ -296,21 +399,17 @@ def done(id: int) -> None:
 
 
 @ams.command()
-def ready() -> None:
+@click.pass_obj
+def ready(store: IssueStore) -> None:
     """Show issues that are ready to work on (unblocked)."""
-    try:
-        store = IssueStore()
-        issues = store.load_all()
+    from rich.table import Table
 
+    console = _console()
+    try:
         # Ready = open AND all blockers are done
-        done_ids = {i.id for i in issues if i.status == Status.DONE}
-        ready_issues = [
-            i for i in issues
-            if i.status == Status.OPEN
-            and all(b in done_ids for b in i.blocked_by)
-        ]
+        ready_ids = store.ready_ids()
 
-        if not ready_issues:
+        if not ready_ids:
             console.print("[dim]No ready work. All tasks are blocked or completed.[/dim]")
             return
 
@@ -318,7 +417,7 @@ def ready() -> None:
         table.add_column("ID", style="bold", width=6)
         table.add_column("Title")
 
-        for issue in ready_issues:
+        for issue in store.get_many(ready_ids):
             table.add_row(f"#{issue.id}", issue.title)
 
         console.print(table)
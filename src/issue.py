@@ -2,28 +2,123 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from enum import Enum
-from typing import Any
+from enum import IntEnum
+from typing import Any, Iterable
 
 
-class Status(Enum):
-    """Issue status values."""
-    OPEN = "open"
-    IN_PROGRESS = "in-progress"
-    DONE = "done"
+class Status(IntEnum):
+    """Issue status values, stored as small integers."""
+    OPEN = 0
+    IN_PROGRESS = 1
+    DONE = 2
 
+    @property
+    def label(self) -> str:
+        """Human-readable name, e.g. "in-progress"."""
+        return _STATUS_LABELS[self]
 
-@dataclass
+    @classmethod
+    def from_label(cls, label: str) -> "Status":
+        """
+        Look up a status by its human-readable name.
+
+        Raises:
+            ValueError: If the label is not a known status.
+        """
+        try:
+            return _STATUS_BY_LABEL[label]
+        except KeyError:
+            raise ValueError(f"{label!r} is not a valid Status")
+
+    @classmethod
+    def from_json(cls, value: Any) -> "Status":
+        """
+        Decode a stored status.
+
+        Accepts the integer form, plus the string labels used by older
+        stores.
+
+        Raises:
+            ValueError: If the value is not a known status.
+        """
+        if isinstance(value, str):
+            return cls.from_label(value)
+        if type(value) is not int or not 0 <= value < len(_STATUS_BY_INT):
+            raise ValueError(f"{value!r} is not a valid Status")
+        return _STATUS_BY_INT[value]
+
+
+# Fixed lookup tables so decoding is a plain index instead of an enum lookup
+_STATUS_BY_INT = (Status.OPEN, Status.IN_PROGRESS, Status.DONE)
+_STATUS_LABELS = ("open", "in-progress", "done")
+_STATUS_BY_LABEL = dict(zip(_STATUS_LABELS, _STATUS_BY_INT))
+
+
+def _split_timestamp(value: datetime | str) -> tuple[str, datetime | None]:
+    """Return a timestamp's ISO string and, if already parsed, its datetime."""
+    if isinstance(value, str):
+        return value, None
+    return value.isoformat(), value
+
+
+@dataclass(slots=True, init=False)
 class Issue:
-    """Represents a single issue in the memory system."""
+    """
+    Represents a single issue in the memory system.
+
+    Timestamps are held as ISO strings, which is what equality compares;
+    the datetime is only parsed when created_at/updated_at are first read.
+    """
 
     id: int
     title: str
     description: str | None
     status: Status
-    created_at: datetime
-    updated_at: datetime
-    blocked_by: list[int] = field(default_factory=list)
+    _created_at: str = field(repr=False)
+    _updated_at: str = field(repr=False)
+    blocked_by: set[int]
+    _created_dt: datetime | None = field(repr=False, compare=False)
+    _updated_dt: datetime | None = field(repr=False, compare=False)
+
+    def __init__(
+        self,
+        id: int,
+        title: str,
+        description: str | None,
+        status: Status,
+        created_at: datetime | str,
+        updated_at: datetime | str,
+        blocked_by: Iterable[int] = (),
+    ) -> None:
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self._created_at, self._created_dt = _split_timestamp(created_at)
+        self._updated_at, self._updated_dt = _split_timestamp(updated_at)
+        self.blocked_by = set(blocked_by)
+
+    @property
+    def created_at(self) -> datetime:
+        """When the issue was created."""
+        if self._created_dt is None:
+            self._created_dt = datetime.fromisoformat(self._created_at)
+        return self._created_dt
+
+    @created_at.setter
+    def created_at(self, value: datetime) -> None:
+        self._created_at, self._created_dt = value.isoformat(), value
+
+    @property
+    def updated_at(self) -> datetime:
+        """When the issue was last modified."""
+        if self._updated_dt is None:
+            self._updated_dt = datetime.fromisoformat(self._updated_at)
+        return self._updated_dt
+
+    @updated_at.setter
+    def updated_at(self, value: datetime) -> None:
+        self._updated_at, self._updated_dt = value.isoformat(), value
 
     def validate_blocked_by(self, existing_ids: set[int]) -> None:
         """
@@ -35,7 +130,7 @@ class Issue:
         Raises:
             ValueError: If any blocked_by ID doesn't exist.
         """
-        invalid_ids = set(self.blocked_by) - existing_ids
+        invalid_ids = self.blocked_by - existing_ids
         if invalid_ids:
             raise ValueError(
                 f"Invalid blocked_by IDs: {sorted(invalid_ids)}. "
@@ -57,10 +152,10 @@ class Issue:
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "status": self.status.value,
-            "created_at": self.created_at.isoformat(),
-            "updated_at": self.updated_at.isoformat(),
-            "blocked_by": self.blocked_by,
+            "status": int(self.status),
+            "created_at": self._created_at,
+            "updated_at": self._updated_at,
+            "blocked_by": sorted(self.blocked_by),
         }
 
     @classmethod
@@ -82,10 +177,10 @@ class Issue:
             id=data["id"],
             title=data["title"],
             description=data.get("description"),
-            status=Status(data["status"]),
-            created_at=datetime.fromisoformat(data["created_at"]),
-            updated_at=datetime.fromisoformat(data["updated_at"]),
-            blocked_by=data.get("blocked_by", []),
+            status=Status.from_json(data["status"]),
+            created_at=data["created_at"],
+            updated_at=data["updated_at"],
+            blocked_by=data.get("blocked_by", ()),
         )
 
     @classmethod
@@ -94,7 +189,7 @@ class Issue:
         id: int,
         title: str,
         description: str | None = None,
-        blocked_by: list[int] | None = None,
+        blocked_by: Iterable[int] | None = None,
     ) -> "Issue":
         """
         Factory method to create a new issue with auto-set timestamps.
@@ -103,7 +198,7 @@ class Issue:
             id: Unique issue ID.
             title: Issue title.
             description: Optional description.
-            blocked_by: List of issue IDs that block this one.
+            blocked_by: IDs of issues that block this one.
 
         Returns:
             New Issue instance with current timestamp.
@@ -116,5 +211,5 @@ class Issue:
             status=Status.OPEN,
             created_at=now,
             updated_at=now,
-            blocked_by=blocked_by or [],
+            blocked_by=blocked_by or (),
         )
@@ -1,9 +1,33 @@
 """Storage layer for the Agent Memory System."""
 
 import json
+import mmap
+import os
+from array import array
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Collection, Iterable, Iterator, NamedTuple
 
-from .issue import Issue
+from .issue import Issue, Status
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def _loads(data: bytes) -> Any:
+    """Parse a JSON document, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
 
 
 class StorageError(Exception):
@@ -11,13 +35,187 @@ class StorageError(Exception):
     pass
 
 
+class Columns(NamedTuple):
+    """
+    Issue fields stored column-wise for bulk scans.
+
+    Row i of every column belongs to the same issue. Statuses are stored
+    as their integer values.
+    """
+
+    ids: array
+    statuses: bytearray
+    titles: list[str]
+    blocked_by: list[Collection[int]]
+
+
+@dataclass
+class LoadedIssues:
+    """Issues loaded from the store, indexed by ID and by blocker."""
+
+    issues: list[Issue]
+    by_id: dict[int, int] = field(default_factory=dict)
+    blocks: dict[int, list[int]] | None = None
+
+    @classmethod
+    def build(cls, issues: list[Issue]) -> "LoadedIssues":
+        """
+        Index a list of issues in a single pass.
+
+        by_id maps each ID to its list position; blocks maps each ID to the
+        IDs of the issues it blocks.
+        """
+        by_id: dict[int, int] = {}
+        blocks: dict[int, list[int]] = {}
+        for idx, issue in enumerate(issues):
+            by_id[issue.id] = idx
+            for b in issue.blocked_by:
+                blocks.setdefault(b, []).append(issue.id)
+        return cls(issues, by_id, blocks)
+
+    def get(self, id: int) -> Issue | None:
+        """Return the issue with the given ID, or None."""
+        idx = self.by_id.get(id)
+        return None if idx is None else self.issues[idx]
+
+    def put(self, issue: Issue) -> None:
+        """Replace the issue with the same ID, or append it if new."""
+        idx = self.by_id.get(issue.id)
+        if idx is None:
+            self.issues.append(issue)
+            self.by_id[issue.id] = len(self.issues) - 1
+            if self.blocks is not None:
+                for b in issue.blocked_by:
+                    self.blocks.setdefault(b, []).append(issue.id)
+        else:
+            self.issues[idx] = issue
+            # Callers may have mutated blocked_by in place, so the old edges
+            # are unknown; rebuild the reverse index on next use.
+            self.blocks = None
+
+    def blocks_of(self, id: int) -> list[int]:
+        """Return the IDs of the issues blocked by the given issue, sorted."""
+        if self.blocks is None:
+            self.blocks = LoadedIssues.build(self.issues).blocks or {}
+        return sorted(self.blocks.get(id, ()))
+
+
+@dataclass
+class DependencyIndex:
+    """
+    Reverse-dependency and status index, persisted as index.json.
+
+    blocks maps an issue ID to the IDs it blocks; buckets maps each status
+    to the IDs currently in it. remaining_blockers counts, per issue, the
+    blockers that are not done yet (Kahn-style topological state), so an
+    open issue is ready exactly when its count is zero.
+    """
+
+    blocks: dict[int, set[int]] = field(default_factory=dict)
+    buckets: dict[Status, set[int]] = field(
+        default_factory=lambda: {status: set() for status in Status}
+    )
+    remaining_blockers: dict[int, int] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, issues: list[Issue]) -> "DependencyIndex":
+        """Index a full list of issues."""
+        index = cls()
+        for issue in issues:
+            index.add(issue.id, issue.status, issue.blocked_by)
+        return index
+
+    def add(self, id: int, status: Status, blocked_by: Iterable[int]) -> None:
+        """Record an issue's status and blockers."""
+        blockers = set(blocked_by)
+        for b in blockers:
+            self.blocks.setdefault(b, set()).add(id)
+        self.buckets[status].add(id)
+
+        # Finishing an issue unblocks one step of each of its dependents
+        if status == Status.DONE:
+            for dependent in self.blocks.get(id, ()):
+                if dependent != id:
+                    self.remaining_blockers[dependent] = (
+                        self.remaining_blockers.get(dependent, 0) - 1
+                    )
+
+        done = self.buckets[Status.DONE]
+        self.remaining_blockers[id] = sum(1 for b in blockers if b not in done)
+
+    def remove(self, id: int, status: Status, blocked_by: Iterable[int]) -> None:
+        """Forget a previously added status and blockers for an issue."""
+        if status == Status.DONE:
+            for dependent in self.blocks.get(id, ()):
+                if dependent != id:
+                    self.remaining_blockers[dependent] = (
+                        self.remaining_blockers.get(dependent, 0) + 1
+                    )
+
+        self.buckets[status].discard(id)
+        for b in set(blocked_by):
+            dependents = self.blocks.get(b)
+            if dependents is not None:
+                dependents.discard(id)
+                if not dependents:
+                    del self.blocks[b]
+        self.remaining_blockers.pop(id, None)
+
+    def ready_ids(self) -> list[int]:
+        """Return open issues whose blockers are all done, sorted by ID."""
+        remaining = self.remaining_blockers
+        return sorted(
+            id for id in self.buckets[Status.OPEN] if remaining.get(id, 0) == 0
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the index (for JSON storage)."""
+        return {
+            "blocks": {str(b): sorted(ids) for b, ids in self.blocks.items()},
+            "status_buckets": {
+                status.label: sorted(ids) for status, ids in self.buckets.items()
+            },
+            "remaining_blockers": {
+                str(id): count
+                for id, count in sorted(self.remaining_blockers.items())
+                if count
+            },
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "DependencyIndex":
+        """
+        Deserialize the index (from JSON storage).
+
+        Raises:
+            KeyError: If required fields are missing.
+            ValueError: If field values are invalid.
+        """
+        index = cls()
+        index.blocks = {int(b): set(ids) for b, ids in data["blocks"].items()}
+        for label, ids in data["status_buckets"].items():
+            index.buckets[Status.from_label(label)] = set(ids)
+        index.remaining_blockers = {
+            int(id): count for id, count in data["remaining_blockers"].items()
+        }
+        return index
+
+
 class IssueStore:
-    """Handles persistence of issues to .ams directory."""
+    """
+    Handles persistence of issues to .ams directory.
+
+    The ID counter and dependency index are batched in memory; callers must
+    call flush() once they are done with the store (the CLI does this after
+    every command).
+    """
 
     AMS_DIR = ".ams"
     ISSUES_FILE = "issues.jsonl"
     META_FILE = "meta.json"
-    VERSION = "1.0"
+    INDEX_FILE = "index.json"
+    OFFSETS_FILE = "offsets.bin"
+    VERSION = "1.1"
 
     def __init__(self, base_path: str = ".") -> None:
         """
@@ -30,6 +228,15 @@ class IssueStore:
         self.ams_path = self.base_path / self.AMS_DIR
         self.issues_path = self.ams_path / self.ISSUES_FILE
         self.meta_path = self.ams_path / self.META_FILE
+        self.index_path = self.ams_path / self.INDEX_FILE
+        self.offsets_path = self.ams_path / self.OFFSETS_FILE
+        self._initialized = False
+        self._cache: LoadedIssues | None = None
+        self._meta_data: dict | None = None
+        self._meta_dirty = False
+        self._offset_map: dict[int, int] | None = None
+        self._index_data: DependencyIndex | None = None
+        self._index_dirty = False
 
     def init(self) -> None:
         """
@@ -41,109 +248,442 @@ class IssueStore:
 
         if not self.issues_path.exists():
             self.issues_path.touch()
+            self._store_offsets({}, 0)
 
         if not self.meta_path.exists():
             self._write_meta({"next_id": 1, "version": self.VERSION})
+            self._flush_meta()
+
+        self._initialized = True
 
     def _ensure_initialized(self) -> None:
-        """Auto-initialize if .ams doesn't exist."""
+        """Auto-initialize if .ams doesn't exist (checked once per store)."""
+        if self._initialized:
+            return
         if not self.ams_path.exists():
             self.init()
+        self._initialized = True
+
+    @property
+    def _meta(self) -> dict:
+        """Contents of meta.json, read from disk on first access."""
+        if self._meta_data is None:
+            self._ensure_initialized()
+            try:
+                with open(self.meta_path, "r") as f:
+                    self._meta_data = json.load(f)
+            except json.JSONDecodeError as e:
+                raise StorageError(f"Corrupted meta.json: {e}")
+        return self._meta_data
+
+    def _write_meta(self, data: dict) -> None:
+        """Replace meta.json contents in memory; written out by flush()."""
+        self._meta_data = data
+        self._meta_dirty = True
+
+    def flush(self) -> None:
+        """
+        Write pending meta.json and index.json changes to disk.
 
-    def _read_meta(self) -> dict:
-        """Read meta.json and return its contents."""
+        Metadata updates (ID counter) and dependency index
+        updates are batched in memory, so callers must flush once they are
+        done with the store.
+        """
+        self._flush_meta()
+
+        if self._index_dirty and self._index_data is not None:
+            data = self._index_data.to_dict()
+            data["stamp"] = self._issues_stamp()
+            tmp_path = self.index_path.with_suffix(".json.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(_dumps(data))
+            os.replace(tmp_path, self.index_path)
+            self._index_dirty = False
+
+    def _flush_meta(self) -> None:
+        """Write meta.json if it has pending changes."""
+        if self._meta_dirty and self._meta_data is not None:
+            with open(self.meta_path, "w") as f:
+                json.dump(self._meta_data, f, indent=2)
+            self._meta_dirty = False
+
+    def _issues_stamp(self) -> list[int]:
+        """Size and mtime of issues.jsonl, used to detect a stale index."""
+        stat = self.issues_path.stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @property
+    def _index(self) -> DependencyIndex:
+        """
+        The dependency index, loaded from index.json on first access.
+
+        If index.json is missing, unreadable, or was written for a different
+        version of issues.jsonl, it is rebuilt from the raw records.
+        """
+        if self._index_data is None:
+            self._index_data = self._read_index()
+        if self._index_data is None:
+            self._index_data = self._build_index()
+            self._index_dirty = True
+        return self._index_data
+
+    def _read_index(self) -> DependencyIndex | None:
+        """Load index.json, or return None if it is absent or stale."""
         self._ensure_initialized()
         try:
-            with open(self.meta_path, "r") as f:
-                return json.load(f)
-        except json.JSONDecodeError as e:
-            raise StorageError(f"Corrupted meta.json: {e}")
-
-    def _write_meta(self, data: dict) -> None:
-        """Write data to meta.json."""
-        with open(self.meta_path, "w") as f:
-            json.dump(data, f, indent=2)
+            with open(self.index_path, "rb") as f:
+                data = _loads(f.read())
+            if data.get("stamp") != self._issues_stamp():
+                return None
+            return DependencyIndex.from_dict(data)
+        except (OSError, KeyError, ValueError, AttributeError):
+            return None
+
+    def _build_index(self) -> DependencyIndex:
+        """Build the dependency index by scanning raw JSONL records."""
+        index = DependencyIndex()
+        for line_num, data in self._iter_records():
+            try:
+                index.add(
+                    data["id"],
+                    Status.from_json(data["status"]),
+                    data.get("blocked_by", []),
+                )
+            except (KeyError, ValueError) as e:
+                raise StorageError(f"Invalid issue data at line {line_num}: {e}")
+        return index
 
     def get_next_id(self) -> int:
         """
         Get the next available issue ID and increment the counter.
 
+        The new counter is kept in memory until flush() is called.
+
         Returns:
             The next available ID.
         """
-        meta = self._read_meta()
+        meta = self._meta
         next_id = meta["next_id"]
         meta["next_id"] = next_id + 1
-        self._write_meta(meta)
+        self._meta_dirty = True
         return next_id
 
+    def prime_cache(self) -> list[Issue]:
+        """
+        Load all issues once and keep them for the rest of this command.
+
+        Later calls to load_all(), get_by_id() and get_all_ids() reuse the
+        cached issues instead of re-parsing the JSONL file.
+
+        Returns:
+            The cached list of Issue objects.
+
+        Raises:
+            StorageError: If JSONL contains invalid data.
+        """
+        self._cache = LoadedIssues.build(self._read_issues())
+        return self._cache.issues
+
+    def _loaded(self) -> LoadedIssues:
+        """Return the primed cache, or freshly loaded issues if not primed."""
+        if self._cache is not None:
+            return self._cache
+        return LoadedIssues.build(self._read_issues())
+
     def load_all(self) -> list[Issue]:
         """
         Load all issues from the JSONL file.
 
+        Returns the primed cache instead when prime_cache() has been called.
+
         Returns:
             List of Issue objects.
 
         Raises:
             StorageError: If JSONL contains invalid data.
         """
-        self._ensure_initialized()
-        issues: list[Issue] = []
+        if self._cache is not None:
+            return self._cache.issues
+        return self._read_issues()
 
+    def _iter_records(self) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Yield (line number, raw dict) for every issue line in the file.
+
+        The file is memory-mapped, so lines are sliced straight out of the
+        page cache instead of being copied into one big read buffer first.
+        This is safe against our own writers: full rewrites replace the
+        file rather than truncating it, and other writes only append or
+        overwrite in place.
+
+        Raises:
+            StorageError: If a line is not valid JSON.
+        """
+        self._ensure_initialized()
         if not self.issues_path.exists() or self.issues_path.stat().st_size == 0:
-            return issues
+            return
 
-        with open(self.issues_path, "r") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
+        with open(self.issues_path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            for line_num, line in enumerate(iter(mm.readline, b""), start=1):
+                if line.isspace():
                     continue
                 try:
-                    data = json.loads(line)
-                    issue = Issue.from_dict(data)
-                    issues.append(issue)
+                    yield line_num, _loads(line)
                 except json.JSONDecodeError as e:
                     raise StorageError(
                         f"Corrupted JSONL at line {line_num}: {e}"
                     )
-                except (KeyError, ValueError) as e:
-                    raise StorageError(
-                        f"Invalid issue data at line {line_num}: {e}"
-                    )
+
+    def _read_issues(self) -> list[Issue]:
+        """Parse every issue in the JSONL file."""
+        issues: list[Issue] = []
+        legacy_status = False
+        for line_num, data in self._iter_records():
+            try:
+                issues.append(Issue.from_dict(data))
+                legacy_status = legacy_status or isinstance(data["status"], str)
+            except (KeyError, ValueError) as e:
+                raise StorageError(
+                    f"Invalid issue data at line {line_num}: {e}"
+                )
+
+        if legacy_status:
+            self._migrate(issues)
 
         return issues
 
+    def _migrate(self, issues: list[Issue]) -> None:
+        """
+        Rewrite a store created before version 1.1.
+
+        Version 1.0 stored statuses as strings ("open"); they are now
+        stored as integers. Runs once, the first time such a file is read.
+        """
+        self._write_all(issues)
+        self._meta["version"] = self.VERSION
+        self._meta_dirty = True
+
+    @staticmethod
+    def _encode(issue: Issue) -> bytes:
+        """Serialize an issue to a single JSONL line."""
+        return _dumps(issue.to_dict()) + b"\n"
+
     def _write_all(self, issues: list[Issue]) -> None:
-        """Write all issues to the JSONL file (overwrites)."""
-        with open(self.issues_path, "w") as f:
+        """
+        Write all issues to the JSONL file (overwrites).
+
+        The issues are written to a temporary file that then replaces
+        issues.jsonl, so a crash mid-write never leaves a truncated file.
+        """
+        offsets: dict[int, int] = {}
+        pos = 0
+        tmp_path = self.issues_path.with_suffix(".jsonl.tmp")
+        with open(tmp_path, "wb") as f:
             for issue in issues:
-                f.write(json.dumps(issue.to_dict()) + "\n")
+                line = self._encode(issue)
+                f.write(line)
+                offsets[issue.id] = pos
+                pos += len(line)
+        os.replace(tmp_path, self.issues_path)
+        self._store_offsets(offsets, pos)
+
+    def _store_offsets(self, offsets: dict[int, int], size: int) -> None:
+        """
+        Persist the id -> byte offset index for a file of the given size.
 
-    def save_issue(self, issue: Issue) -> None:
+        offsets.bin is a flat array of int64s: the size of issues.jsonl it
+        describes, followed by (id, offset) pairs.
         """
-        Save an issue to the store.
+        data = array("q", [size])
+        for id, offset in offsets.items():
+            data.append(id)
+            data.append(offset)
+        tmp_path = self.offsets_path.with_suffix(".bin.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data.tobytes())
+        os.replace(tmp_path, self.offsets_path)
+        self._offset_map = offsets
+
+    def _append_offset(
+        self, id: int, offset: int, old_size: int, new_size: int
+    ) -> None:
+        """
+        Record one appended line in offsets.bin without rewriting it.
+
+        Only done when the index described the file before the append;
+        otherwise it is left stale and rebuilt on next use.
+        """
+        try:
+            with open(self.offsets_path, "r+b") as f:
+                header = array("q")
+                header.frombytes(f.read(8))
+                if header[0] != old_size:
+                    self._offset_map = None
+                    return
+                # Pair first, then header, so a crash leaves the index stale
+                f.seek(0, 2)
+                f.write(array("q", [id, offset]).tobytes())
+                f.seek(0)
+                f.write(array("q", [new_size]).tobytes())
+        except (OSError, ValueError, IndexError):
+            self._offset_map = None
+            return
+        if self._offset_map is not None:
+            self._offset_map[id] = offset
+
+    def _scan_offsets(self) -> dict[int, int]:
+        """Build the id -> byte offset index by scanning the JSONL file."""
+        offsets: dict[int, int] = {}
+        pos = 0
+        with open(self.issues_path, "rb") as f:
+            for line_num, line in enumerate(f, start=1):
+                if line.strip():
+                    try:
+                        offsets[_loads(line)["id"]] = pos
+                    except (json.JSONDecodeError, KeyError) as e:
+                        raise StorageError(
+                            f"Corrupted JSONL at line {line_num}: {e}"
+                        )
+                pos += len(line)
+        return offsets
+
+    def _offsets(self) -> dict[int, int]:
+        """
+        Get the id -> byte offset index, building it lazily.
+
+        The index is stored in offsets.bin together with the size of the
+        JSONL file it describes, and rebuilt whenever the sizes disagree.
+
+        The decoded index is kept in memory for the life of the store, so
+        repeated lookups validate and convert it only once.
+
+        Returns:
+            Mapping of issue ID to the byte offset of its line.
+        """
+        if self._offset_map is not None:
+            return self._offset_map
 
-        If the issue ID exists, updates it. Otherwise, appends it.
+        self._ensure_initialized()
+        size = self.issues_path.stat().st_size
+        data = array("q")
+        try:
+            with open(self.offsets_path, "rb") as f:
+                data.frombytes(f.read())
+        except (OSError, ValueError):
+            pass
+        if data and data[0] == size:
+            self._offset_map = dict(zip(data[1::2], data[2::2]))
+            return self._offset_map
+
+        offsets = self._scan_offsets()
+        self._store_offsets(offsets, size)
+        return offsets
+
+    def save_all(self, issues: list[Issue]) -> None:
+        """
+        Write the given issues to the store, replacing its contents.
 
         Args:
-            issue: The Issue to save.
+            issues: Every issue that should be persisted.
         """
         self._ensure_initialized()
-        issues = self.load_all()
+        self._write_all(issues)
+        if self._cache is not None:
+            self._cache = LoadedIssues.build(issues)
+        if self._index_data is not None:
+            self._index_data = DependencyIndex.build(issues)
+            self._index_dirty = True
 
-        # Check if issue exists (update) or is new (append)
-        existing_idx = None
-        for idx, existing in enumerate(issues):
-            if existing.id == issue.id:
-                existing_idx = idx
-                break
+    def save_issue_append(self, issue: Issue) -> None:
+        """
+        Append a new issue to the end of the JSONL file.
 
-        if existing_idx is not None:
-            issues[existing_idx] = issue
-        else:
-            issues.append(issue)
+        Only the new line is written; existing issues are not re-read.
 
-        self._write_all(issues)
+        Args:
+            issue: A new Issue whose ID is not yet in the store.
+        """
+        self._ensure_initialized()
+        line = self._encode(issue)
+        index = self._index
+
+        # Persist the ID counter before the issue exists on disk, so an
+        # interrupted command can never hand out the same ID twice
+        self._flush_meta()
+
+        with open(self.issues_path, "a+b") as f:
+            size = f.seek(0, 2)
+            offset = size
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b"\n":
+                    line = b"\n" + line
+                    offset += 1
+            f.write(line)
+
+        self._append_offset(issue.id, offset, size, size + len(line))
+
+        index.add(issue.id, issue.status, issue.blocked_by)
+        self._index_dirty = True
+
+        if self._cache is not None:
+            self._cache.put(issue)
+
+    def save_issue_update(self, issue: Issue) -> None:
+        """
+        Persist changes to an existing issue.
+
+        Rewrites only the issue's own line when the new line has the same
+        length as the old one, otherwise falls back to a full rewrite.
+
+        Args:
+            issue: The modified Issue.
+        """
+        self._ensure_initialized()
+        if self._cache is not None:
+            self._cache.put(issue)
+
+        line = self._encode(issue)
+        index = self._index
+        offset = self._offsets().get(issue.id)
+        if offset is not None:
+            with open(self.issues_path, "r+b") as f:
+                f.seek(offset)
+                old = f.readline()
+                try:
+                    old_data = _loads(old)
+                    same_issue = old_data.get("id") == issue.id
+                    old_status = Status.from_json(old_data["status"])
+                except (KeyError, ValueError, AttributeError):
+                    same_issue = False
+                if same_issue and len(old) == len(line):
+                    f.seek(offset)
+                    f.write(line)
+                    index.remove(issue.id, old_status, old_data.get("blocked_by", []))
+                    index.add(issue.id, issue.status, issue.blocked_by)
+                    self._index_dirty = True
+                    return
+
+        loaded = self._loaded()
+        loaded.put(issue)
+        self.save_all(loaded.issues)
+
+    def save_issue(self, issue: Issue) -> None:
+        """
+        Save an issue to the store.
+
+        If the issue ID exists, updates it. Otherwise, appends it. Which
+        one is decided from the offset index, without parsing any issues.
+
+        Args:
+            issue: The Issue to save.
+        """
+        if issue.id in self._offsets():
+            self.save_issue_update(issue)
+        else:
+            self.save_issue_append(issue)
 
     def get_by_id(self, id: int) -> Issue | None:
         """
@@ -152,14 +692,171 @@ class IssueStore:
         Args:
             id: The issue ID to find.
 
+        Without a primed cache, seeks straight to the issue's line using
+        the offset index and parses only that line. The index covers every
+        issue, so an ID missing from it does not exist; only a line that
+        does not match its offset falls back to a full scan.
+
         Returns:
             The Issue if found, None otherwise.
         """
-        issues = self.load_all()
-        for issue in issues:
-            if issue.id == id:
-                return issue
-        return None
+        if self._cache is not None:
+            return self._cache.get(id)
+
+        offset = self._offsets().get(id)
+        if offset is None:
+            return None
+        issue = self._read_issue_at(offset)
+        if issue is not None and issue.id == id:
+            return issue
+
+        return self._loaded().get(id)
+
+    def get_many(self, ids: Iterable[int]) -> list[Issue]:
+        """
+        Get several issues by ID in one pass over the file.
+
+        Args:
+            ids: The issue IDs to find.
+
+        Without a primed cache, opens the file once and seeks to each
+        issue's line in offset order. IDs missing from the offset index do
+        not exist; lines that do not match their offset fall back to a
+        single full scan.
+
+        Returns:
+            The issues found, in the order of ids. Unknown IDs are skipped.
+        """
+        ids = list(ids)
+        if self._cache is not None:
+            found = {id: issue for id in ids if (issue := self._cache.get(id))}
+        else:
+            offsets = self._offsets()
+            wanted = sorted((offsets[id], id) for id in set(ids) if id in offsets)
+            found = {}
+            mismatched = []
+            with open(self.issues_path, "rb") as f:
+                for offset, id in wanted:
+                    f.seek(offset)
+                    issue = self._parse_line(f.readline())
+                    if issue is not None and issue.id == id:
+                        found[id] = issue
+                    else:
+                        mismatched.append(id)
+
+            if mismatched:
+                loaded = self._loaded()
+                for id in mismatched:
+                    if issue := loaded.get(id):
+                        found[id] = issue
+
+        return [found[id] for id in ids if id in found]
+
+    def _read_issue_at(self, offset: int) -> Issue | None:
+        """Parse the issue on the line starting at a byte offset, if valid."""
+        with open(self.issues_path, "rb") as f:
+            f.seek(offset)
+            return self._parse_line(f.readline())
+
+    @staticmethod
+    def _parse_line(line: bytes) -> Issue | None:
+        """Parse one JSONL line into an Issue, or None if it is malformed."""
+        try:
+            return Issue.from_dict(_loads(line))
+        except (KeyError, ValueError, AttributeError, TypeError):
+            return None
+
+    def load_columnar(self) -> Columns:
+        """
+        Load the fields shown by list as parallel arrays.
+
+        Without a primed cache this reads the raw records directly and
+        never builds Issue objects or parses timestamps.
+
+        Returns:
+            Columns with one row per issue, in file order.
+
+        Raises:
+            StorageError: If JSONL contains invalid data.
+        """
+        cols = Columns(array("i"), bytearray(), [], [])
+        if self._cache is not None:
+            for issue in self._cache.issues:
+                cols.ids.append(issue.id)
+                cols.statuses.append(issue.status)
+                cols.titles.append(issue.title)
+                cols.blocked_by.append(issue.blocked_by)
+            return cols
+
+        for line_num, data in self._iter_records():
+            try:
+                status = Status.from_json(data["status"])
+                cols.ids.append(data["id"])
+                cols.statuses.append(status)
+                cols.titles.append(data["title"])
+                cols.blocked_by.append(data.get("blocked_by", []))
+            except (KeyError, ValueError) as e:
+                raise StorageError(f"Invalid issue data at line {line_num}: {e}")
+        return cols
+
+    def iter_ids(self) -> Iterator[int]:
+        """
+        Iterate over all issue IDs.
+
+        Without a primed cache this reads only the "id" field of each line,
+        skipping full Issue construction.
+
+        Raises:
+            StorageError: If JSONL contains invalid data.
+        """
+        if self._cache is not None:
+            yield from self._cache.by_id
+            return
+        for line_num, data in self._iter_records():
+            try:
+                yield data["id"]
+            except KeyError as e:
+                raise StorageError(f"Invalid issue data at line {line_num}: {e}")
+
+    def ready_ids(self) -> list[int]:
+        """
+        Get the IDs of open issues whose blockers are all done.
+
+        Answered from the dependency index without reading issues.jsonl.
+
+        Returns:
+            Sorted list of ready issue IDs.
+        """
+        return self._index.ready_ids()
+
+    def remaining_blockers(self, id: int) -> int:
+        """
+        Get how many of an issue's blockers are not done yet.
+
+        Args:
+            id: The issue ID.
+
+        Returns:
+            Number of unfinished blockers (0 if the issue is unblocked).
+        """
+        return self._index.remaining_blockers.get(id, 0)
+
+    def blocks_of(self, id: int) -> list[int]:
+        """
+        Get the issues that the given issue blocks (reverse lookup).
+
+        Args:
+            id: The blocking issue's ID.
+
+        Uses the primed cache if there is one, otherwise the persisted
+        dependency index, so no issues need to be parsed.
+
+        Returns:
+            IDs of issues whose blocked_by contains the given ID.
+        """
+        if self._cache is not None:
+            return self._cache.blocks_of(id)
+        return sorted(self._index.blocks.get(id, ()))
 
     def get_all_ids(self) -> set[int]:
         """
@@ -168,5 +865,4 @@ class IssueStore:
         Returns:
             Set of all issue IDs in the store.
         """
-        issues = self.load_all()
-        return {issue.id for issue in issues}
+        return set(self.iter_ids())
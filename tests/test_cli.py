@@ -0,0 +1,202 @@
+"""Tests for the ams command-line interface."""
+
+import pytest
+from click.testing import CliRunner
+
+from src import cli
+from src.cli import ams
+from src.issue import Issue
+from src.storage import IssueStore
+
+
+@pytest.fixture
+def runner(tmp_path, monkeypatch):
+    """A CLI runner working in an empty directory."""
+    monkeypatch.chdir(tmp_path)
+    return CliRunner()
+
+
+@pytest.mark.parametrize(
+    "args", [["show", "1"], ["done", "1"], ["update", "1", "-s", "done"]]
+)
+def test_missing_issue_in_empty_directory(runner, args):
+    result = runner.invoke(ams, args)
+
+    assert result.exit_code == 1
+    assert not isinstance(result.exception, FileNotFoundError)
+    assert "Issue #1 not found" in result.output
+
+
+def test_done_reports_newly_ready_work(runner):
+    for args in (
+        ["create", "Design"],
+        ["create", "Build", "--blocked-by", "1"],
+        ["create", "Ship", "--blocked-by", "1", "--blocked-by", "2"],
+    ):
+        assert runner.invoke(ams, args).exit_code == 0
+
+    result = runner.invoke(ams, ["done", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "This issue was blocking" in result.output
+    ready_section = result.output.split("Newly ready work:")[1]
+    assert "#2 Build" in ready_section
+    assert "Ship" not in ready_section
+
+    result = runner.invoke(ams, ["ready"])
+    assert "Build" in result.output
+    assert "Ship" not in result.output
+
+
+def test_done_fetches_dependents_in_one_batch(runner, monkeypatch):
+    runner.invoke(ams, ["create", "Base"])
+    for title in ("X", "Y", "Z"):
+        runner.invoke(ams, ["create", title, "--blocked-by", "1"])
+
+    lookups = []
+    original = IssueStore.get_by_id
+    monkeypatch.setattr(
+        IssueStore, "get_by_id", lambda self, id: lookups.append(id) or original(self, id)
+    )
+    result = runner.invoke(ams, ["done", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert lookups == [1]
+    assert "#2 X" in result.output and "#4 Z" in result.output
+
+
+def _list_rows(output):
+    """Return the rendered lines that mention an issue ID."""
+    return [line for line in output.splitlines() if "#" in line]
+
+
+@pytest.mark.parametrize("max_rows", [500, 0])
+def test_list_renderers_agree(runner, monkeypatch, max_rows):
+    monkeypatch.setattr(cli, "LIST_TABLE_MAX_ROWS", max_rows)
+    runner.invoke(ams, ["create", "[red]Base[/red]"])
+    runner.invoke(ams, ["create", "Next", "--blocked-by", "1"])
+
+    result = runner.invoke(ams, ["list"])
+
+    assert result.exit_code == 0, result.output
+    header = next(line for line in result.output.splitlines() if "Blocked By" in line)
+    assert header.index("Status") < header.index("Title") < header.index("Blocked By")
+    base, following = _list_rows(result.output)
+    assert "[red]Base[/red]" in base
+    assert following.index("Next") < following.rindex("#1")
+    table_mode = max_rows > 0
+    assert ("━" in result.output or "─" in result.output) == table_mode
+
+
+def test_list_many_issues_uses_line_renderer(runner):
+    store = IssueStore()
+    for _ in range(cli.LIST_TABLE_MAX_ROWS + 1):
+        store.save_issue_append(Issue.create(store.get_next_id(), "Task"))
+    store.flush()
+
+    result = runner.invoke(ams, ["list", "--limit", "0"])
+
+    assert result.exit_code == 0, result.output
+    rows = _list_rows(result.output)
+    assert len(rows) == cli.LIST_TABLE_MAX_ROWS + 1
+    assert rows[-1].split() == ["#501", "open", "Task", "-"]
+
+
+def _create_tasks(count):
+    store = IssueStore()
+    for n in range(1, count + 1):
+        store.save_issue_append(Issue.create(store.get_next_id(), f"Task {n}"))
+    store.flush()
+
+
+def test_list_shows_requested_page(runner):
+    _create_tasks(5)
+
+    result = runner.invoke(ams, ["list", "--limit", "2", "--offset", "1"])
+
+    assert result.exit_code == 0, result.output
+    assert "Task 2" in result.output and "Task 3" in result.output
+    assert "Task 1" not in result.output and "Task 4" not in result.output
+    assert "Showing 2–3 of 5" in result.output
+
+
+def test_list_without_footer_when_page_holds_everything(runner):
+    _create_tasks(3)
+
+    result = runner.invoke(ams, ["list", "--limit", "0"])
+
+    assert "Task 3" in result.output
+    assert "Showing" not in result.output
+
+
+def test_list_filters_before_paginating(runner):
+    _create_tasks(4)
+    runner.invoke(ams, ["done", "2"])
+
+    result = runner.invoke(ams, ["list", "-s", "open", "-n", "1", "--offset", "1"])
+
+    assert "Task 3" in result.output
+    assert "Showing 2–2 of 3" in result.output
+
+
+def test_list_page_past_the_end(runner):
+    _create_tasks(3)
+
+    result = runner.invoke(ams, ["list", "--offset", "10"])
+
+    assert result.exit_code == 0
+    assert "No issues on this page (3 total)." in result.output
+
+
+def test_list_empty_store(runner):
+    result = runner.invoke(ams, ["list"])
+
+    assert result.exit_code == 0
+    assert "No issues found." in result.output
+
+
+def test_update_blockers_are_a_set(runner):
+    _create_tasks(4)
+
+    result = runner.invoke(
+        ams,
+        ["update", "4", "--add-blocker", "3", "--add-blocker", "1",
+         "--add-blocker", "3", "--add-blocker", "2"],
+    )
+    assert result.exit_code == 0, result.output
+    result = runner.invoke(
+        ams, ["update", "4", "--remove-blocker", "2", "--remove-blocker", "2",
+              "--remove-blocker", "9"],
+    )
+    assert result.exit_code == 0, result.output
+
+    line = IssueStore().issues_path.read_text().splitlines()[3]
+    assert '"blocked_by":[1,3]' in line
+    assert IssueStore().get_by_id(4).blocked_by == {1, 3}
+    assert IssueStore().ready_ids() == [1, 2, 3]
+
+
+def test_update_rejects_unknown_or_self_blocker(runner):
+    _create_tasks(2)
+
+    unknown = runner.invoke(ams, ["update", "2", "--add-blocker", "99"])
+    itself = runner.invoke(ams, ["update", "2", "--add-blocker", "2"])
+
+    assert unknown.exit_code == 1 and "#99 does not exist" in unknown.output
+    assert itself.exit_code == 1 and "cannot block itself" in itself.output
+    assert IssueStore().get_by_id(2).blocked_by == set()
+
+
+def test_list_does_not_build_issues(runner, monkeypatch):
+    _create_tasks(3)
+    runner.invoke(ams, ["done", "2"])
+
+    def fail(data):
+        raise AssertionError("list built an Issue")
+
+    monkeypatch.setattr(Issue, "from_dict", fail)
+    result = runner.invoke(ams, ["list", "-s", "done"])
+
+    assert result.exit_code == 0, result.output
+    assert "Task 2" in result.output
+    assert "Task 1" not in result.output
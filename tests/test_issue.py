@@ -0,0 +1,46 @@
+"""Tests for the Issue data class."""
+
+from datetime import datetime, timezone
+
+from src.issue import Issue, Status
+
+CREATED = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+UPDATED = datetime(2024, 2, 3, 4, 5, 6, 789012, tzinfo=timezone.utc)
+
+
+def _issue():
+    return Issue(
+        id=1,
+        title="A",
+        description=None,
+        status=Status.OPEN,
+        created_at=CREATED,
+        updated_at=UPDATED,
+        blocked_by=[2],
+    )
+
+
+def test_constructor_takes_public_timestamp_names():
+    issue = _issue()
+
+    assert issue.created_at == CREATED
+    assert issue.updated_at == UPDATED
+    assert issue.blocked_by == {2}
+    assert "_created_at" not in repr(issue)
+
+
+def test_equality_does_not_depend_on_parsing():
+    issue = _issue()
+    loaded = Issue.from_dict(issue.to_dict())
+    assert loaded == issue
+
+    assert loaded.created_at == CREATED  # parse one side only
+    assert loaded == issue
+    assert issue == Issue.from_dict(issue.to_dict())
+
+
+def test_equality_compares_timestamps():
+    other = _issue()
+    other.updated_at = CREATED
+
+    assert other != _issue()
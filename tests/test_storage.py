@@ -0,0 +1,296 @@
+"""Tests for IssueStore persistence and the dependency index."""
+
+import json
+import os
+from array import array
+from datetime import datetime, timezone
+
+import pytest
+
+from src import storage
+from src.issue import Issue, Status
+from src.storage import IssueStore, LoadedIssues
+
+FIXED_TIME = datetime(2024, 1, 2, 3, 4, 5, 678901, tzinfo=timezone.utc)
+
+
+def _make_store(tmp_path, *titles_and_blockers):
+    """Create a store holding one issue per (title, blocked_by) pair."""
+    store = IssueStore(tmp_path)
+    for title, blocked_by in titles_and_blockers:
+        issue = Issue.create(store.get_next_id(), title, blocked_by=blocked_by)
+        issue.created_at = issue.updated_at = FIXED_TIME
+        store.save_issue(issue)
+    store.flush()
+    return store
+
+
+def _assert_consistent(tmp_path, expected_ready, titles):
+    """Check lookups and ready work through a store that starts cold."""
+    store = IssueStore(tmp_path)
+    assert store.ready_ids() == expected_ready
+    for id, title in titles.items():
+        assert store.get_by_id(id).title == title
+
+
+def _read_offsets(store):
+    """Return the (size header, id -> offset map) stored in offsets.bin."""
+    data = array("q")
+    data.frombytes(store.offsets_path.read_bytes())
+    return data[0], dict(zip(data[1::2], data[2::2]))
+
+
+def _line_offsets(store):
+    """Compute the id -> offset map directly from issues.jsonl."""
+    offsets, pos = {}, 0
+    for line in store.issues_path.read_bytes().splitlines(keepends=True):
+        offsets[json.loads(line)["id"]] = pos
+        pos += len(line)
+    return offsets
+
+
+def test_append_keeps_offsets_file_current(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", None), ("C", [1]))
+
+    size, offsets = _read_offsets(store)
+    assert size == store.issues_path.stat().st_size
+    assert offsets == _line_offsets(store)
+    assert IssueStore(tmp_path).get_by_id(3).title == "C"
+
+
+def test_stale_offsets_file_is_rebuilt(tmp_path):
+    store = _make_store(tmp_path, ("A", None))
+    with open(store.issues_path, "a") as f:
+        f.write(json.dumps(Issue.create(2, "Written elsewhere").to_dict()) + "\n")
+
+    fresh = IssueStore(tmp_path)
+    assert fresh.get_by_id(2).title == "Written elsewhere"
+    size, offsets = _read_offsets(fresh)
+    assert size == store.issues_path.stat().st_size
+    assert offsets == _line_offsets(fresh)
+
+
+def test_missing_offsets_file_is_rebuilt(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", None))
+    store.offsets_path.unlink()
+
+    fresh = IssueStore(tmp_path)
+    assert fresh.get_by_id(2).title == "B"
+    assert _read_offsets(fresh)[1] == _line_offsets(fresh)
+
+
+def test_lookup_in_empty_directory(tmp_path):
+    store = IssueStore(tmp_path)
+
+    assert store.get_by_id(1) is None
+    assert store.issues_path.exists()
+
+
+def test_save_issue_does_not_parse_the_store(tmp_path, monkeypatch):
+    _make_store(tmp_path, ("A", None), ("B", None))
+    store = IssueStore(tmp_path)
+
+    def fail():
+        raise AssertionError("issues.jsonl was fully parsed")
+
+    monkeypatch.setattr(store, "_read_issues", fail)
+    existing = store.get_by_id(2)
+    existing.status = Status.DONE
+    store.save_issue(existing)
+    store.save_issue(Issue.create(store.get_next_id(), "C"))
+    store.flush()
+
+    monkeypatch.undo()
+    assert IssueStore(tmp_path).ready_ids() == [1, 3]
+    assert IssueStore(tmp_path).get_by_id(2).status == Status.DONE
+
+
+def test_get_many_returns_issues_in_requested_order(tmp_path):
+    _make_store(tmp_path, ("A", None), ("B", None), ("C", None))
+
+    cold = IssueStore(tmp_path)
+    assert [i.title for i in cold.get_many([3, 99, 1, 2])] == ["C", "A", "B"]
+
+    primed = IssueStore(tmp_path)
+    primed.prime_cache()
+    assert [i.title for i in primed.get_many([3, 99, 1])] == ["C", "A"]
+
+
+def test_unknown_id_does_not_parse_the_store(tmp_path, monkeypatch):
+    _make_store(tmp_path, ("A", None))
+    store = IssueStore(tmp_path)
+
+    def fail():
+        raise AssertionError("issues.jsonl was fully parsed")
+
+    monkeypatch.setattr(store, "_read_issues", fail)
+    assert store.get_by_id(99) is None
+    assert store.get_many([99, 1])[0].title == "A"
+
+
+def test_lookup_does_not_migrate_legacy_store(tmp_path):
+    ams = tmp_path / ".ams"
+    ams.mkdir()
+    record = {"id": 1, "title": "A", "description": None, "status": "open",
+              "created_at": FIXED_TIME.isoformat(),
+              "updated_at": FIXED_TIME.isoformat(), "blocked_by": []}
+    (ams / "issues.jsonl").write_text(json.dumps(record) + "\n")
+    (ams / "meta.json").write_text(json.dumps({"next_id": 2, "version": "1.0"}))
+    before = (ams / "issues.jsonl").read_bytes()
+
+    store = IssueStore(tmp_path)
+    assert store.get_by_id(99) is None
+    assert store.get_by_id(1).status == Status.OPEN
+    store.flush()
+
+    assert (ams / "issues.jsonl").read_bytes() == before
+    assert json.loads((ams / "meta.json").read_text())["version"] == "1.0"
+
+
+def test_blocks_of_is_sorted_with_and_without_cache(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", None))
+    # Write dependents out of ID order
+    for id in (4, 3):
+        issue = Issue.create(id, f"Blocked {id}", blocked_by=[1])
+        store.save_issue(issue)
+    store.flush()
+
+    assert LoadedIssues.build(store.load_all()).blocks_of(1) == [3, 4]
+    assert IssueStore(tmp_path).blocks_of(1) == [3, 4]
+    primed = IssueStore(tmp_path)
+    primed.prime_cache()
+    assert primed.blocks_of(1) == [3, 4]
+
+
+def _write_sample_store(path):
+    store = _make_store(path, ("Café ☕", None), ("B", [1]))
+    issue = store.get_by_id(1)
+    issue.status = Status.DONE
+    store.save_issue(issue)
+    store.flush()
+    return store
+
+
+def test_stdlib_json_fallback_round_trips(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "orjson", None)
+    store = _write_sample_store(tmp_path)
+
+    line = store.issues_path.read_bytes().splitlines()[0]
+    assert "Café ☕".encode() in line
+    assert b", " not in line and b": " not in line
+    fresh = IssueStore(tmp_path)
+    assert fresh.get_by_id(1).title == "Café ☕"
+    assert fresh.ready_ids() == [2]
+
+
+def test_stdlib_json_fallback_matches_orjson(tmp_path, monkeypatch):
+    pytest.importorskip("orjson")
+    with_orjson = _write_sample_store(tmp_path / "orjson").issues_path.read_bytes()
+    monkeypatch.setattr(storage, "orjson", None)
+    stdlib = _write_sample_store(tmp_path / "stdlib").issues_path.read_bytes()
+
+    assert stdlib == with_orjson
+
+
+def test_load_columnar_matches_cached_issues(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", [1]), ("C", [2, 1]))
+    issue = store.get_by_id(2)
+    issue.status = Status.IN_PROGRESS
+    store.save_issue(issue)
+
+    cold = IssueStore(tmp_path).load_columnar()
+    primed = IssueStore(tmp_path)
+    primed.prime_cache()
+    warm = primed.load_columnar()
+
+    assert list(cold.ids) == list(warm.ids) == [1, 2, 3]
+    assert cold.statuses == warm.statuses == bytearray([0, 1, 0])
+    assert cold.titles == warm.titles == ["A", "B", "C"]
+    assert [sorted(b) for b in cold.blocked_by] == [[], [1], [1, 2]]
+    assert [sorted(b) for b in warm.blocked_by] == [[], [1], [1, 2]]
+
+
+def test_migrates_version_1_0_string_statuses(tmp_path):
+    ams = tmp_path / ".ams"
+    ams.mkdir()
+    records = [
+        {"id": 1, "title": "A", "description": None, "status": "done",
+         "created_at": FIXED_TIME.isoformat(), "updated_at": FIXED_TIME.isoformat(),
+         "blocked_by": []},
+        {"id": 2, "title": "B", "description": None, "status": "open",
+         "created_at": FIXED_TIME.isoformat(), "updated_at": FIXED_TIME.isoformat(),
+         "blocked_by": [1]},
+        {"id": 3, "title": "C", "description": None, "status": "in-progress",
+         "created_at": FIXED_TIME.isoformat(), "updated_at": FIXED_TIME.isoformat(),
+         "blocked_by": []},
+    ]
+    (ams / "issues.jsonl").write_text("".join(json.dumps(r) + "\n" for r in records))
+    (ams / "meta.json").write_text(json.dumps({"next_id": 4, "version": "1.0"}))
+
+    store = IssueStore(tmp_path)
+    issues = store.load_all()
+    store.flush()
+
+    assert [i.status for i in issues] == [Status.DONE, Status.OPEN, Status.IN_PROGRESS]
+    lines = (ams / "issues.jsonl").read_text().splitlines()
+    assert [json.loads(line)["status"] for line in lines] == [2, 0, 1]
+    assert json.loads((ams / "meta.json").read_text())["version"] == IssueStore.VERSION
+    assert IssueStore(tmp_path).ready_ids() == [2]
+
+
+def test_update_in_place_keeps_lookups_and_ready_work(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", [1]))
+    inode = store.issues_path.stat().st_ino
+
+    issue = store.get_by_id(1)
+    issue.status = Status.DONE
+    store.save_issue_update(issue)
+    store.flush()
+
+    # Same line length, so the file was patched rather than replaced.
+    assert store.issues_path.stat().st_ino == inode
+    assert store.get_by_id(1).status == Status.DONE
+    assert store.ready_ids() == [2]
+    _assert_consistent(tmp_path, [2], {1: "A", 2: "B"})
+
+
+def test_update_with_new_length_rewrites_file(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", [1]), ("C", None))
+    inode = store.issues_path.stat().st_ino
+
+    issue = store.get_by_id(1)
+    issue.title = "A much longer title"
+    issue.status = Status.DONE
+    store.save_issue_update(issue)
+    store.flush()
+
+    # The line grew, so the whole file was rewritten and replaced.
+    assert store.issues_path.stat().st_ino != inode
+    assert store.get_by_id(1).title == "A much longer title"
+    assert store.get_by_id(3).title == "C"
+    assert store.ready_ids() == [2, 3]
+    _assert_consistent(tmp_path, [2, 3], {1: "A much longer title", 2: "B", 3: "C"})
+
+
+def test_index_rebuilt_when_issues_file_grows(tmp_path):
+    store = _make_store(tmp_path, ("A", None))
+    assert store.index_path.exists()
+
+    extra = Issue.create(2, "Written elsewhere")
+    with open(store.issues_path, "a") as f:
+        f.write(json.dumps(extra.to_dict()) + "\n")
+
+    assert IssueStore(tmp_path).ready_ids() == [1, 2]
+
+
+def test_index_rebuilt_when_issues_file_modified(tmp_path):
+    store = _make_store(tmp_path, ("A", None), ("B", None))
+    stat = store.issues_path.stat()
+
+    # Same size, different content and mtime.
+    text = store.issues_path.read_text().replace('"status":0', '"status":2', 1)
+    store.issues_path.write_text(text)
+    os.utime(store.issues_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert store.issues_path.stat().st_size == stat.st_size
+
+    assert IssueStore(tmp_path).ready_ids() == [2]